@@ -1,9 +1,43 @@
 """Schema to Tool - Convert JSON Schema to OpenAI/Anthropic tool definitions."""
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from schema_to_tool.converter import SchemaConverter
-from schema_to_tool.formats.openai import OpenAIFormatter
-from schema_to_tool.formats.anthropic import AnthropicFormatter
+if TYPE_CHECKING:
+    from schema_to_tool.converter import SchemaConverter, ToolMetadata
+    from schema_to_tool.formats.anthropic import AnthropicFormatter
+    from schema_to_tool.formats.openai import OpenAIFormatter
+
+__all__ = [
+    "SchemaConverter",
+    "ToolMetadata",
+    "OpenAIFormatter",
+    "AnthropicFormatter",
+    "__version__",
+]
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, e.g. for ``__version__`` in the CLI, stays cheap.
+_LAZY_IMPORTS = {
+    "SchemaConverter": "schema_to_tool.converter",
+    "ToolMetadata": "schema_to_tool.converter",
+    "OpenAIFormatter": "schema_to_tool.formats.openai",
+    "AnthropicFormatter": "schema_to_tool.formats.anthropic",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["SchemaConverter", "OpenAIFormatter", "AnthropicFormatter", "__version__"]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
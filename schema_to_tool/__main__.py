@@ -0,0 +1,89 @@
+"""Console entry point for schema-to-tool.
+
+The ``convert`` command is handled with argparse so that one-shot conversions
+don't pay for importing click. Everything else, including ``--help`` and
+``validate``, is delegated to the click CLI in :mod:`schema_to_tool.cli`.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from schema_to_tool.formats import FORMAT_NAMES
+
+
+def _fast_main(argv: list[str]) -> None:
+    """Run the ``convert`` command without importing click.
+
+    Args:
+        argv: Arguments following the ``convert`` subcommand.
+    """
+    # Disable prefix matching so "--form" is rejected, as it is by click
+    parser = argparse.ArgumentParser(prog="schema-to-tool convert", allow_abbrev=False)
+    parser.add_argument("schema_file", help="Path to the JSON Schema file.")
+    parser.add_argument(
+        "--format",
+        "-f",
+        choices=FORMAT_NAMES,
+        required=True,
+        help="Output format for the tool definition.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file path. If not specified, prints to stdout.",
+    )
+    parser.add_argument(
+        "--indent",
+        "-i",
+        type=int,
+        default=2,
+        help="JSON indentation level (default: 2).",
+    )
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.schema_file):
+        parser.error(f"Path '{args.schema_file}' does not exist.")
+
+    from schema_to_tool._output import write_bytes
+    from schema_to_tool.converter import SchemaConverter
+
+    try:
+        converter = SchemaConverter.from_file(args.schema_file)
+        result = converter.to_bytes(args.format, indent=args.indent)
+
+        if args.output:
+            write_bytes(args.output, result)
+            print(f"Tool definition written to {args.output}")
+        else:
+            sys.stdout.buffer.write(result)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.flush()
+
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in schema file: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _rich_main() -> None:
+    """Run the full click-based CLI."""
+    from schema_to_tool.cli import main as cli_main
+
+    cli_main()
+
+
+def main() -> None:
+    """Entry point for the CLI."""
+    argv = sys.argv[1:]
+    if argv[:1] == ["convert"] and not {"-h", "--help"} & set(argv):
+        _fast_main(argv[1:])
+    else:
+        _rich_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""JSON encoding/decoding backends.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Results never depend on which backend is in use; wherever orjson
+is stricter or lossier than the standard library, the document is handed to
+the standard library instead:
+
+- integers outside the 64-bit range, which orjson parses as floats and
+  refuses to serialize;
+- input orjson rejects but the standard library accepts, such as ``NaN``,
+  ``Infinity``, ``1e400`` or UTF-16 encoded bytes;
+- ``NaN`` and infinite floats, which orjson serializes as ``null``.
+
+Decoding errors are always ``json.JSONDecodeError``.
+"""
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+# Any integer outside the 64-bit range has at least 19 digits. Matches inside
+# strings or floats only cost a slower parse, never a wrong one.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+# A null value in orjson output, which may have been a non-finite float.
+# Matches inside strings only cost a slower encode, never a wrong one.
+_NULL_VALUE = re.compile(rb"[:,\[]\s*null\b")
+
+
+def _has_long_digits(data: str | bytes) -> bool:
+    if isinstance(data, str):
+        return _LONG_DIGITS.search(data) is not None
+    return _LONG_DIGITS_BYTES.search(data) is not None
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    if orjson is not None and not _has_long_digits(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the stdlib accept what it can, or raise its own error
+            pass
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any) -> bytes | None:
+    """Encode with orjson, or return None if the stdlib must be used."""
+    try:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        # e.g. integers beyond 64 bits; let the stdlib handle or reject it
+        return None
+    if _NULL_VALUE.search(data) and _has_non_finite(obj):
+        return None
+    return data
+
+
+def dumps(obj: Any, indent: int = 2) -> str:
+    """Serialize an object to a JSON string.
+
+    orjson only supports two-space indentation, so other indent levels
+    always go through the standard library.
+    """
+    if orjson is not None and indent == 2:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data.decode("utf-8")
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, indent: int = 2) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    With orjson this skips building an intermediate ``str``.
+    """
+    if orjson is not None and indent == 2:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,24 @@
+"""Low-level file output helpers."""
+
+import os
+
+
+def write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to a file, creating or truncating it.
+
+    Writes straight to the file descriptor, bypassing Python's buffered and
+    text I/O layers, so the data is handed to the kernel without extra copies.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    # 0o666 filtered by the umask, matching open() and Path.write_bytes()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
@@ -7,9 +7,7 @@ from pathlib import Path
 import click
 
 from schema_to_tool import __version__
-from schema_to_tool.converter import SchemaConverter
-from schema_to_tool.formats.openai import OpenAIFormatter
-from schema_to_tool.formats.anthropic import AnthropicFormatter
+from schema_to_tool.formats import FORMAT_NAMES
 
 
 @click.group()
@@ -24,7 +22,7 @@ def cli():
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["openai", "anthropic"]),
+    type=click.Choice(FORMAT_NAMES),
     required=True,
     help="Output format for the tool definition.",
 )
@@ -52,13 +50,15 @@ def convert(schema_file: str, format: str, output: str | None, indent: int):
 
         schema-to-tool convert schema.json -f anthropic -o tool.json
     """
+    from schema_to_tool._output import write_bytes
+    from schema_to_tool.converter import SchemaConverter
+
     try:
         converter = SchemaConverter.from_file(schema_file)
-        result = converter.to_json(format, indent=indent)
+        result = converter.to_bytes(format, indent=indent)
 
         if output:
-            output_path = Path(output)
-            output_path.write_text(result)
+            write_bytes(output, result)
             click.echo(f"Tool definition written to {output}")
         else:
             click.echo(result)
@@ -74,12 +74,85 @@ def convert(schema_file: str, format: str, output: str | None, indent: int):
         sys.exit(1)
 
 
+@cli.command("convert-all")
+@click.argument("schema_files", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(FORMAT_NAMES),
+    required=True,
+    help="Output format for the tool definitions.",
+)
+@click.option(
+    "--outdir",
+    "-d",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Directory to write tool definitions to, one file per schema.",
+)
+@click.option(
+    "--indent",
+    "-i",
+    type=int,
+    default=2,
+    help="JSON indentation level (default: 2).",
+)
+def convert_all(schema_files: tuple[str, ...], format: str, outdir: str, indent: int):
+    """Convert many JSON Schema files to tool definitions.
+
+    SCHEMA_FILES are the paths to the JSON Schema files to convert. Each tool
+    definition is written to OUTDIR under the same file name as its schema.
+
+    Examples:
+
+        schema-to-tool convert-all schemas/*.json --format openai --outdir tools/
+    """
+    from schema_to_tool._output import write_bytes
+    from schema_to_tool.converter import SchemaConverter
+
+    out_dir = Path(outdir)
+    out_paths = [out_dir / Path(schema_file).name for schema_file in schema_files]
+
+    if len(set(out_paths)) != len(out_paths):
+        click.echo("Error: Schema files must have distinct file names", err=True)
+        sys.exit(1)
+    for schema_file, out_path in zip(schema_files, out_paths):
+        if out_path.resolve() == Path(schema_file).resolve():
+            click.echo(f"Error: Output would overwrite {schema_file}", err=True)
+            sys.exit(1)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Collect per-file failures so one bad schema is reported against its
+    # path without stopping the others.
+    results = SchemaConverter.from_files(schema_files, return_exceptions=True)
+
+    all_ok = True
+    for schema_file, out_path, result in zip(schema_files, out_paths, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            write_bytes(str(out_path), result.to_bytes(format, indent=indent))
+            click.echo(f"Tool definition written to {out_path}")
+        except json.JSONDecodeError as e:
+            all_ok = False
+            click.echo(
+                f"Error: Invalid JSON in schema file {schema_file}: {e}", err=True
+            )
+        except Exception as e:
+            all_ok = False
+            click.echo(f"Error: {schema_file}: {e}", err=True)
+
+    if not all_ok:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("tool_file", type=click.Path(exists=True))
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["openai", "anthropic"]),
+    type=click.Choice(FORMAT_NAMES),
     required=True,
     help="Format of the tool definition to validate.",
 )
@@ -94,9 +167,12 @@ def validate(tool_file: str, format: str):
 
         schema-to-tool validate tool.json -f anthropic
     """
+    from schema_to_tool import _json
+    from schema_to_tool.formats import FORMATTERS
+
     try:
-        with open(tool_file, "r") as f:
-            tool = json.load(f)
+        with open(tool_file, "rb") as f:
+            tool = _json.loads(f.read())
     except json.JSONDecodeError as e:
         click.echo(f"Error: Invalid JSON: {e}", err=True)
         sys.exit(1)
@@ -104,21 +180,29 @@ def validate(tool_file: str, format: str):
     # Handle both single tool and array of tools
     tools = tool if isinstance(tool, list) else [tool]
 
+    # Resolve the format once rather than per tool
+    if format not in FORMATTERS:
+        click.echo(f"Error: Unknown format: {format}", err=True)
+        sys.exit(1)
+
+    validator = FORMATTERS[format].validate
+
+    if format == "openai":
+
+        def get_name(t: dict, default: str) -> str:
+            return t.get("function", {}).get("name", default)
+
+    else:
+
+        def get_name(t: dict, default: str) -> str:
+            return t.get("name", default)
+
     all_valid = True
     for i, t in enumerate(tools):
-        if format == "openai":
-            is_valid, errors = OpenAIFormatter.validate(t)
-        elif format == "anthropic":
-            is_valid, errors = AnthropicFormatter.validate(t)
-        else:
-            click.echo(f"Error: Unknown format: {format}", err=True)
-            sys.exit(1)
+        is_valid, errors = validator(t)
 
-        tool_name = ""
-        if format == "openai" and isinstance(t, dict):
-            tool_name = t.get("function", {}).get("name", f"tool[{i}]")
-        elif format == "anthropic" and isinstance(t, dict):
-            tool_name = t.get("name", f"tool[{i}]")
+        if isinstance(t, dict):
+            tool_name = get_name(t, f"tool[{i}]")
         else:
             tool_name = f"tool[{i}]"
 
@@ -1,13 +1,40 @@
 """Core conversion logic for JSON Schema to tool definitions."""
 
+import string
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
-import json
+
+from schema_to_tool import _json
+from schema_to_tool.formats import FORMAT_NAMES
+
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+# Single-pass translation table for SchemaConverter._normalize_name: ASCII
+# spaces and hyphens become underscores, other disallowed ASCII characters are
+# deleted, and valid name characters (absent from the table) map to themselves.
+_NAME_TABLE = str.maketrans(
+    {
+        cp: "_" if chr(cp) in " -" else None
+        for cp in range(128)
+        if chr(cp) not in _NAME_CHARS
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ToolMetadata:
+    """Format-independent description of a tool extracted from a schema."""
+
+    name: str
+    description: str
+    parameters: dict[str, Any]
 
 
 class SchemaConverter:
     """Converts JSON Schema to tool definitions for various AI platforms."""
 
-    SUPPORTED_FORMATS = ["openai", "anthropic"]
+    SUPPORTED_FORMATS = list(FORMAT_NAMES)
 
     def __init__(self, schema: dict[str, Any]):
         """Initialize with a JSON Schema.
@@ -33,63 +60,114 @@ class SchemaConverter:
         Returns:
             SchemaConverter instance.
         """
-        with open(filepath, "r") as f:
-            schema = json.load(f)
+        # Hand the raw bytes to the parser so UTF-8 decoding happens as part
+        # of parsing rather than as a separate pass over the file
+        with open(filepath, "rb") as f:
+            schema = _json.loads(f.read())
         return cls(schema)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "SchemaConverter":
+    def from_files(
+        cls,
+        filepaths: Iterable[str],
+        max_workers: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list["SchemaConverter | Exception"]:
+        """Create SchemaConverters from many JSON files.
+
+        Files are read concurrently on a thread pool, since opening and
+        reading each file is dominated by I/O latency.
+
+        Args:
+            filepaths: Paths to JSON Schema files.
+            max_workers: Maximum number of concurrent reads. Defaults to the
+                ThreadPoolExecutor default.
+            return_exceptions: If True, a file that fails to load yields its
+                exception in place of a converter instead of aborting the
+                whole batch.
+
+        Returns:
+            SchemaConverter instances (or exceptions), in the same order as
+            ``filepaths``.
+        """
+
+        def load(filepath: str) -> "SchemaConverter | Exception":
+            try:
+                return cls.from_file(filepath)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        filepaths = list(filepaths)
+        if len(filepaths) <= 1:
+            return [load(filepath) for filepath in filepaths]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load, filepaths))
+
+    @classmethod
+    def from_json(cls, json_str: str | bytes) -> "SchemaConverter":
         """Create a SchemaConverter from a JSON string.
 
         Args:
-            json_str: JSON Schema as a string.
+            json_str: JSON Schema as a string or UTF-8 encoded bytes.
 
         Returns:
             SchemaConverter instance.
         """
-        schema = json.loads(json_str)
+        schema = _json.loads(json_str)
         return cls(schema)
 
-    def _extract_tool_metadata(self) -> dict[str, Any]:
+    def _extract_tool_metadata(self) -> ToolMetadata:
         """Extract tool metadata from schema.
 
         Returns:
-            Dictionary with name, description, and parameters.
+            ToolMetadata with name, description, and parameters.
         """
-        # If schema has a 'name' field at top level, use it as tool name
-        name = self.schema.get("name", self.schema.get("title", "unnamed_tool"))
+        schema = self.schema
+        get = schema.get
+
+        # If schema has a 'name' field at top level, use it as tool name;
+        # only fall back to 'title' when it is missing
+        name = schema["name"] if "name" in schema else get("title", "unnamed_tool")
 
         # Get description from schema
-        description = self.schema.get("description", "")
+        description = get("description", "")
 
         # Build parameters schema
-        if "properties" in self.schema:
+        if "properties" in schema:
             # Schema is directly a parameters object
+            additional = get("additionalProperties")
             parameters = {
                 "type": "object",
-                "properties": self.schema.get("properties", {}),
+                "properties": schema["properties"],
+                **({"required": schema["required"]} if "required" in schema else {}),
+                **(
+                    {"additionalProperties": additional}
+                    if additional is not None
+                    else {}
+                ),
             }
-            if "required" in self.schema:
-                parameters["required"] = self.schema["required"]
-            if self.schema.get("additionalProperties") is not None:
-                parameters["additionalProperties"] = self.schema["additionalProperties"]
-        elif "parameters" in self.schema:
+        elif "parameters" in schema:
             # Schema already has parameters nested
-            parameters = self.schema["parameters"]
+            parameters = schema["parameters"]
         else:
             # Treat entire schema as parameters
-            parameters = self.schema.copy()
+            parameters = schema.copy()
             parameters.pop("name", None)
             parameters.pop("title", None)
             parameters.pop("description", None)
             if "type" not in parameters:
                 parameters["type"] = "object"
 
-        return {
-            "name": self._normalize_name(name),
-            "description": description,
-            "parameters": parameters,
-        }
+        return ToolMetadata(
+            name=self._normalize_name(name),
+            description=description,
+            parameters=parameters,
+        )
 
     def _normalize_name(self, name: str) -> str:
         """Normalize a name to be a valid function name.
@@ -100,10 +178,12 @@ class SchemaConverter:
         Returns:
             Normalized name with only alphanumeric and underscores.
         """
-        # Replace spaces and hyphens with underscores
-        normalized = name.replace(" ", "_").replace("-", "_")
-        # Remove any characters that aren't alphanumeric or underscore
-        normalized = "".join(c for c in normalized if c.isalnum() or c == "_")
+        # Replace spaces and hyphens with underscores and drop any other
+        # ASCII characters that aren't alphanumeric or underscore
+        normalized = name.translate(_NAME_TABLE)
+        # Non-ASCII characters pass through the table; keep only alphanumerics
+        if not normalized.isascii():
+            normalized = "".join(c for c in normalized if c.isascii() or c.isalnum())
         # Ensure it doesn't start with a number
         if normalized and normalized[0].isdigit():
             normalized = "_" + normalized
@@ -127,18 +207,11 @@ class SchemaConverter:
                 f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
             )
 
-        metadata = self._extract_tool_metadata()
+        from schema_to_tool.formats import FORMATTERS
 
-        if format == "openai":
-            from schema_to_tool.formats.openai import OpenAIFormatter
+        formatter = FORMATTERS[format]
 
-            return OpenAIFormatter.format(metadata)
-        elif format == "anthropic":
-            from schema_to_tool.formats.anthropic import AnthropicFormatter
-
-            return AnthropicFormatter.format(metadata)
-
-        raise ValueError(f"Unknown format: {format}")
+        return formatter.format(self._extract_tool_metadata())
 
     def to_json(self, format: str, indent: int = 2) -> str:
         """Convert schema to JSON string in the specified format.
@@ -151,4 +224,17 @@ class SchemaConverter:
             JSON string of the tool definition.
         """
         tool_def = self.convert(format)
-        return json.dumps(tool_def, indent=indent)
+        return _json.dumps(tool_def, indent=indent)
+
+    def to_bytes(self, format: str, indent: int = 2) -> bytes:
+        """Convert schema to UTF-8 encoded JSON in the specified format.
+
+        Args:
+            format: Target format ('openai' or 'anthropic').
+            indent: JSON indentation level.
+
+        Returns:
+            UTF-8 encoded JSON of the tool definition.
+        """
+        tool_def = self.convert(format)
+        return _json.dumps_bytes(tool_def, indent=indent)
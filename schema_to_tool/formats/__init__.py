@@ -1,6 +1,54 @@
-"""Format handlers for different tool definition formats."""
+"""Format handlers for different tool definition formats.
 
-from schema_to_tool.formats.openai import OpenAIFormatter
-from schema_to_tool.formats.anthropic import AnthropicFormatter
+Formatter modules are imported on first use (PEP 562), so code that only
+needs the supported format names, such as the CLI, stays cheap to import.
+"""
 
-__all__ = ["OpenAIFormatter", "AnthropicFormatter"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from schema_to_tool.formats.anthropic import AnthropicFormatter
+    from schema_to_tool.formats.openai import OpenAIFormatter
+
+    Formatter = type[OpenAIFormatter] | type[AnthropicFormatter]
+
+    # Formatter class for each supported format name
+    FORMATTERS: dict[str, Formatter]
+
+# Module and class implementing each supported format
+_FORMATTER_PATHS = {
+    "openai": ("schema_to_tool.formats.openai", "OpenAIFormatter"),
+    "anthropic": ("schema_to_tool.formats.anthropic", "AnthropicFormatter"),
+}
+
+# Supported format names, in display order
+FORMAT_NAMES: tuple[str, ...] = tuple(_FORMATTER_PATHS)
+
+__all__ = ["OpenAIFormatter", "AnthropicFormatter", "FORMATTERS", "FORMAT_NAMES"]
+
+
+def _load(module_name: str, class_name: str) -> type:
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name == "FORMATTERS":
+        value = {
+            format: _load(module_name, class_name)
+            for format, (module_name, class_name) in _FORMATTER_PATHS.items()
+        }
+    else:
+        for module_name, class_name in _FORMATTER_PATHS.values():
+            if class_name == name:
+                value = _load(module_name, class_name)
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
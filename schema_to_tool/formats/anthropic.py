@@ -1,13 +1,19 @@
 """Anthropic tool format handler."""
 
-from typing import Any
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+if TYPE_CHECKING:
+    from schema_to_tool.converter import ToolMetadata
 
 
 class AnthropicFormatter:
     """Formats tool definitions for Anthropic's tool use API."""
 
     @staticmethod
-    def format(metadata: dict[str, Any]) -> dict[str, Any]:
+    def format(metadata: "ToolMetadata | Mapping[str, Any]") -> dict[str, Any]:
         """Format tool metadata as Anthropic tool definition.
 
         Anthropic expects tools in this format:
@@ -22,15 +28,25 @@ class AnthropicFormatter:
         }
 
         Args:
-            metadata: Dictionary with name, description, and parameters.
+            metadata: ToolMetadata, or a mapping with 'name', 'description'
+                and 'parameters' keys.
 
         Returns:
             Anthropic-formatted tool definition.
         """
+        if isinstance(metadata, Mapping):
+            name = metadata["name"]
+            description = metadata["description"]
+            parameters = metadata["parameters"]
+        else:
+            name = metadata.name
+            description = metadata.description
+            parameters = metadata.parameters
+
         return {
-            "name": metadata["name"],
-            "description": metadata["description"],
-            "input_schema": metadata["parameters"],
+            "name": name,
+            "description": description,
+            "input_schema": parameters,
         }
 
     @staticmethod
@@ -43,49 +59,76 @@ class AnthropicFormatter:
         Returns:
             Tuple of (is_valid, list of error messages).
         """
-        errors = []
-
         if not isinstance(tool, dict):
             return False, ["Tool must be a dictionary"]
 
+        errors: list[str] = []
+        add_error = errors.append
+
         # Check required fields
         if "name" not in tool:
-            errors.append("Tool must have a 'name' field")
+            add_error("Tool must have a 'name' field")
         elif not isinstance(tool["name"], str):
-            errors.append("Tool 'name' must be a string")
+            add_error("Tool 'name' must be a string")
         elif not tool["name"]:
-            errors.append("Tool 'name' cannot be empty")
+            add_error("Tool 'name' cannot be empty")
 
         if "description" in tool and not isinstance(tool["description"], str):
-            errors.append("Tool 'description' must be a string")
+            add_error("Tool 'description' must be a string")
 
         if "input_schema" not in tool:
-            errors.append("Tool must have an 'input_schema' field")
+            add_error("Tool must have an 'input_schema' field")
         elif not isinstance(tool["input_schema"], dict):
-            errors.append("Tool 'input_schema' must be a dictionary")
+            add_error("Tool 'input_schema' must be a dictionary")
         else:
             schema = tool["input_schema"]
             if schema.get("type") != "object":
-                errors.append("Tool input_schema 'type' must be 'object'")
+                add_error("Tool input_schema 'type' must be 'object'")
             if "properties" not in schema:
-                errors.append("Tool input_schema must have 'properties'")
+                add_error("Tool input_schema must have 'properties'")
+
+        return not errors, errors
 
-        return len(errors) == 0, errors
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: Literal[False] = ...
+    ) -> dict[str, Any]: ...
+
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: Literal[True]
+    ) -> Mapping[str, Any]: ...
+
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: bool = ...
+    ) -> Mapping[str, Any]: ...
 
     @staticmethod
-    def extract_schema(tool: dict[str, Any]) -> dict[str, Any]:
+    def extract_schema(
+        tool: dict[str, Any], read_only: bool = False
+    ) -> Mapping[str, Any]:
         """Extract the original schema from an Anthropic tool definition.
 
         Args:
             tool: Anthropic tool definition.
+            read_only: If True, return a read-only view layered over the
+                tool's schema instead of copying it into a new dict.
 
         Returns:
-            JSON Schema extracted from the tool.
+            JSON Schema extracted from the tool. A new dict by default, or a
+            read-only mapping when ``read_only`` is True.
         """
         schema = {
             "name": tool.get("name", ""),
             "description": tool.get("description", ""),
         }
         input_schema = tool.get("input_schema", {})
+        if read_only:
+            # Schema keys take precedence over name/description, as with update()
+            return MappingProxyType(ChainMap(input_schema, schema))
         schema.update(input_schema)
         return schema
@@ -1,13 +1,19 @@
 """OpenAI function calling format handler."""
 
-from typing import Any
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+if TYPE_CHECKING:
+    from schema_to_tool.converter import ToolMetadata
 
 
 class OpenAIFormatter:
     """Formats tool definitions for OpenAI's function calling API."""
 
     @staticmethod
-    def format(metadata: dict[str, Any]) -> dict[str, Any]:
+    def format(metadata: "ToolMetadata | Mapping[str, Any]") -> dict[str, Any]:
         """Format tool metadata as OpenAI function definition.
 
         OpenAI expects tools in this format:
@@ -25,17 +31,27 @@ class OpenAIFormatter:
         }
 
         Args:
-            metadata: Dictionary with name, description, and parameters.
+            metadata: ToolMetadata, or a mapping with 'name', 'description'
+                and 'parameters' keys.
 
         Returns:
             OpenAI-formatted tool definition.
         """
+        if isinstance(metadata, Mapping):
+            name = metadata["name"]
+            description = metadata["description"]
+            parameters = metadata["parameters"]
+        else:
+            name = metadata.name
+            description = metadata.description
+            parameters = metadata.parameters
+
         return {
             "type": "function",
             "function": {
-                "name": metadata["name"],
-                "description": metadata["description"],
-                "parameters": metadata["parameters"],
+                "name": name,
+                "description": description,
+                "parameters": parameters,
             },
         }
 
@@ -49,58 +65,82 @@ class OpenAIFormatter:
         Returns:
             Tuple of (is_valid, list of error messages).
         """
-        errors = []
-
         if not isinstance(tool, dict):
             return False, ["Tool must be a dictionary"]
 
+        errors: list[str] = []
+        add_error = errors.append
+
         # Check top-level structure
         if tool.get("type") != "function":
-            errors.append("Tool 'type' must be 'function'")
+            add_error("Tool 'type' must be 'function'")
 
         if "function" not in tool:
-            errors.append("Tool must have a 'function' field")
-            return len(errors) == 0, errors
+            add_error("Tool must have a 'function' field")
+            return not errors, errors
 
         func = tool["function"]
 
         # Check function structure
         if not isinstance(func, dict):
-            errors.append("'function' must be a dictionary")
-            return len(errors) == 0, errors
+            add_error("'function' must be a dictionary")
+            return not errors, errors
 
         if "name" not in func:
-            errors.append("Function must have a 'name' field")
+            add_error("Function must have a 'name' field")
         elif not isinstance(func["name"], str):
-            errors.append("Function 'name' must be a string")
+            add_error("Function 'name' must be a string")
         elif not func["name"]:
-            errors.append("Function 'name' cannot be empty")
+            add_error("Function 'name' cannot be empty")
 
         if "description" in func and not isinstance(func["description"], str):
-            errors.append("Function 'description' must be a string")
+            add_error("Function 'description' must be a string")
 
         if "parameters" not in func:
-            errors.append("Function must have a 'parameters' field")
+            add_error("Function must have a 'parameters' field")
         elif not isinstance(func["parameters"], dict):
-            errors.append("Function 'parameters' must be a dictionary")
+            add_error("Function 'parameters' must be a dictionary")
         else:
             params = func["parameters"]
             if params.get("type") != "object":
-                errors.append("Function parameters 'type' must be 'object'")
+                add_error("Function parameters 'type' must be 'object'")
             if "properties" not in params:
-                errors.append("Function parameters must have 'properties'")
+                add_error("Function parameters must have 'properties'")
+
+        return not errors, errors
 
-        return len(errors) == 0, errors
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: Literal[False] = ...
+    ) -> dict[str, Any]: ...
+
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: Literal[True]
+    ) -> Mapping[str, Any]: ...
+
+    @overload
+    @staticmethod
+    def extract_schema(
+        tool: dict[str, Any], read_only: bool = ...
+    ) -> Mapping[str, Any]: ...
 
     @staticmethod
-    def extract_schema(tool: dict[str, Any]) -> dict[str, Any]:
+    def extract_schema(
+        tool: dict[str, Any], read_only: bool = False
+    ) -> Mapping[str, Any]:
         """Extract the original schema from an OpenAI tool definition.
 
         Args:
             tool: OpenAI tool definition.
+            read_only: If True, return a read-only view layered over the
+                tool's schema instead of copying it into a new dict.
 
         Returns:
-            JSON Schema extracted from the tool.
+            JSON Schema extracted from the tool. A new dict by default, or a
+            read-only mapping when ``read_only`` is True.
         """
         func = tool.get("function", {})
         schema = {
@@ -108,5 +148,8 @@ class OpenAIFormatter:
             "description": func.get("description", ""),
         }
         params = func.get("parameters", {})
+        if read_only:
+            # Schema keys take precedence over name/description, as with update()
+            return MappingProxyType(ChainMap(params, schema))
         schema.update(params)
         return schema
@@ -0,0 +1,80 @@
+"""Tests for the command line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from schema_to_tool.cli import cli
+
+SCHEMA = {
+    "name": "get weather",
+    "description": "Get the weather",
+    "properties": {"location": {"type": "string"}},
+    "required": ["location"],
+}
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+def write_schema(path, schema=SCHEMA):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(schema))
+    return str(path)
+
+
+class TestConvertAll:
+    def test_writes_one_file_per_schema(self, runner, tmp_path):
+        a = write_schema(tmp_path / "in" / "a.json")
+        b = write_schema(tmp_path / "in" / "b.json", {"title": "B", "properties": {}})
+        outdir = tmp_path / "out"
+
+        result = runner.invoke(
+            cli, ["convert-all", a, b, "-f", "anthropic", "-d", str(outdir)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads((outdir / "a.json").read_text())["name"] == "get_weather"
+        assert json.loads((outdir / "b.json").read_text())["name"] == "B"
+
+    def test_rejects_duplicate_file_names(self, runner, tmp_path):
+        a = write_schema(tmp_path / "x" / "schema.json")
+        b = write_schema(tmp_path / "y" / "schema.json")
+        outdir = tmp_path / "out"
+
+        result = runner.invoke(
+            cli, ["convert-all", a, b, "-f", "openai", "-d", str(outdir)]
+        )
+
+        assert result.exit_code == 1
+        assert "distinct file names" in result.output
+        assert not outdir.exists()
+
+    def test_refuses_to_overwrite_input(self, runner, tmp_path):
+        a = write_schema(tmp_path / "schema.json")
+
+        result = runner.invoke(
+            cli, ["convert-all", a, "-f", "openai", "-d", str(tmp_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "would overwrite" in result.output
+        assert json.loads((tmp_path / "schema.json").read_text()) == SCHEMA
+
+    def test_reports_failing_path_and_converts_the_rest(self, runner, tmp_path):
+        good = write_schema(tmp_path / "in" / "good.json")
+        bad = tmp_path / "in" / "bad.json"
+        bad.write_text("{bad")
+        outdir = tmp_path / "out"
+
+        result = runner.invoke(
+            cli, ["convert-all", str(bad), good, "-f", "openai", "-d", str(outdir)]
+        )
+
+        assert result.exit_code == 1
+        assert f"Invalid JSON in schema file {bad}" in result.output
+        assert (outdir / "good.json").exists()
+        assert not (outdir / "bad.json").exists()
@@ -0,0 +1,122 @@
+"""Tests for SchemaConverter."""
+
+import json
+import subprocess
+import sys
+import weakref
+
+import pytest
+
+from schema_to_tool.converter import SchemaConverter
+
+SCHEMA = {
+    "name": "get weather",
+    "description": "Get the weather",
+    "properties": {"location": {"type": "string"}},
+    "required": ["location"],
+}
+
+
+def test_rejects_non_dict():
+    with pytest.raises(ValueError, match="Schema must be a dictionary"):
+        SchemaConverter([])
+    with pytest.raises(ValueError, match="Schema must be a dictionary"):
+        SchemaConverter.from_json("[]")
+
+
+def test_from_json_runs_subclass_init():
+    class TaggedConverter(SchemaConverter):
+        def __init__(self, schema):
+            super().__init__(schema)
+            self.tag = "custom"
+
+    converter = TaggedConverter.from_json('{"name": "t"}')
+    assert isinstance(converter, TaggedConverter)
+    assert converter.tag == "custom"
+
+
+def test_from_file_runs_subclass_init(tmp_path):
+    class TaggedConverter(SchemaConverter):
+        def __init__(self, schema):
+            super().__init__(schema)
+            self.tag = "custom"
+
+    path = tmp_path / "schema.json"
+    path.write_text('{"name": "t"}')
+    assert TaggedConverter.from_file(str(path)).tag == "custom"
+
+
+def test_convert_result_can_be_mutated():
+    converter = SchemaConverter(dict(SCHEMA))
+    tool = converter.convert("openai")
+    tool["function"]["name"] = "changed"
+    tool["function"]["parameters"]["required"] = []
+    again = converter.convert("openai")
+    assert again["function"]["name"] == "get_weather"
+    assert again["function"]["parameters"]["required"] == ["location"]
+    assert '"get_weather"' in converter.to_json("openai")
+
+
+def test_convert_reflects_schema_changes():
+    converter = SchemaConverter(dict(SCHEMA))
+    assert converter.convert("anthropic")["name"] == "get_weather"
+    converter.schema["description"] = "new"
+    assert converter.convert("anthropic")["description"] == "new"
+    converter.schema = {"name": "other", "properties": {}}
+    assert converter.convert("anthropic")["name"] == "other"
+
+
+def test_supported_formats():
+    assert SchemaConverter.SUPPORTED_FORMATS == ["openai", "anthropic"]
+    with pytest.raises(ValueError, match="Unsupported format: xml"):
+        SchemaConverter(SCHEMA).convert("xml")
+
+
+def test_from_files_preserves_order(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"schema{i}.json"
+        path.write_text(f'{{"name": "tool_{i}"}}')
+        paths.append(str(path))
+
+    converters = SchemaConverter.from_files(paths)
+
+    assert [c.convert("anthropic")["name"] for c in converters] == [
+        f"tool_{i}" for i in range(5)
+    ]
+    assert SchemaConverter.from_files([]) == []
+
+
+def test_import_defers_formatters():
+    code = (
+        "import sys\n"
+        "import schema_to_tool.converter\n"
+        "assert 'schema_to_tool.formats.openai' not in sys.modules\n"
+        "assert 'schema_to_tool.formats.anthropic' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_from_files_return_exceptions(tmp_path):
+    good = tmp_path / "good.json"
+    good.write_text('{"name": "good"}')
+    bad = tmp_path / "bad.json"
+    bad.write_text("{bad")
+    paths = [str(bad), str(good)]
+
+    with pytest.raises(json.JSONDecodeError):
+        SchemaConverter.from_files(paths)
+
+    results = SchemaConverter.from_files(paths, return_exceptions=True)
+    assert isinstance(results[0], json.JSONDecodeError)
+    assert results[1].convert("anthropic")["name"] == "good"
+
+
+def test_supports_weakrefs_and_extra_attributes():
+    converter = SchemaConverter(SCHEMA)
+    assert weakref.ref(converter)() is converter
+    converter.tag = "custom"
+    assert converter.tag == "custom"
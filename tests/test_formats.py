@@ -0,0 +1,111 @@
+"""Tests for the OpenAI and Anthropic formatters."""
+
+from collections import OrderedDict
+
+import pytest
+
+from schema_to_tool.converter import ToolMetadata
+from schema_to_tool.formats.anthropic import AnthropicFormatter
+from schema_to_tool.formats.openai import OpenAIFormatter
+
+OPENAI_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "get_weather",
+        "description": "Get the weather",
+        "parameters": {"type": "object", "properties": {}},
+    },
+}
+
+ANTHROPIC_TOOL = {
+    "name": "get_weather",
+    "description": "Get the weather",
+    "input_schema": {"type": "object", "properties": {}},
+}
+
+METADATA = {
+    "name": "get_weather",
+    "description": "Get the weather",
+    "parameters": {"type": "object", "properties": {}},
+}
+
+
+@pytest.mark.parametrize("metadata", [METADATA, ToolMetadata(**METADATA)])
+def test_format_accepts_mapping_and_tool_metadata(metadata):
+    assert OpenAIFormatter.format(metadata) == OPENAI_TOOL
+    assert AnthropicFormatter.format(metadata) == ANTHROPIC_TOOL
+
+
+class TestValidate:
+    def test_openai_valid(self):
+        assert OpenAIFormatter.validate(OPENAI_TOOL) == (True, [])
+
+    def test_anthropic_valid(self):
+        assert AnthropicFormatter.validate(ANTHROPIC_TOOL) == (True, [])
+
+    def test_openai_accepts_dict_subclass(self):
+        tool = OrderedDict(OPENAI_TOOL)
+        tool["function"] = OrderedDict(OPENAI_TOOL["function"])
+        assert OpenAIFormatter.validate(tool) == (True, [])
+
+    def test_anthropic_accepts_dict_subclass(self):
+        tool = OrderedDict(ANTHROPIC_TOOL)
+        tool["input_schema"] = OrderedDict(ANTHROPIC_TOOL["input_schema"])
+        assert AnthropicFormatter.validate(tool) == (True, [])
+
+    def test_openai_invalid(self):
+        tool = {"type": "function", "function": {"name": "", "parameters": []}}
+        assert OpenAIFormatter.validate(tool) == (
+            False,
+            [
+                "Function 'name' cannot be empty",
+                "Function 'parameters' must be a dictionary",
+            ],
+        )
+
+    def test_anthropic_invalid(self):
+        assert AnthropicFormatter.validate({"name": 1}) == (
+            False,
+            [
+                "Tool 'name' must be a string",
+                "Tool must have an 'input_schema' field",
+            ],
+        )
+
+    def test_non_dict(self):
+        assert OpenAIFormatter.validate([]) == (False, ["Tool must be a dictionary"])
+        assert AnthropicFormatter.validate([]) == (
+            False,
+            ["Tool must be a dictionary"],
+        )
+
+
+class TestExtractSchema:
+    def test_openai_copy(self):
+        schema = OpenAIFormatter.extract_schema(OPENAI_TOOL)
+        assert schema == {
+            "name": "get_weather",
+            "description": "Get the weather",
+            "type": "object",
+            "properties": {},
+        }
+        schema["extra"] = True
+        assert "extra" not in OPENAI_TOOL["function"]["parameters"]
+
+    @pytest.mark.parametrize(
+        "formatter, tool",
+        [(OpenAIFormatter, OPENAI_TOOL), (AnthropicFormatter, ANTHROPIC_TOOL)],
+    )
+    def test_read_only_matches_copy(self, formatter, tool):
+        view = formatter.extract_schema(tool, read_only=True)
+        copied = formatter.extract_schema(tool)
+        assert dict(view) == copied
+        assert list(view) == list(copied)
+        with pytest.raises(TypeError):
+            view["name"] = "other"
+
+    def test_read_only_schema_keys_take_precedence(self):
+        tool = dict(ANTHROPIC_TOOL, input_schema={"description": "inner"})
+        view = AnthropicFormatter.extract_schema(tool, read_only=True)
+        copied = AnthropicFormatter.extract_schema(tool)
+        assert view["description"] == copied["description"] == "inner"
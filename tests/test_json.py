@@ -0,0 +1,70 @@
+"""Tests for the JSON backend wrapper."""
+
+import json
+
+import pytest
+
+from schema_to_tool import _json
+from schema_to_tool.converter import SchemaConverter
+
+BIG = 12345678901234567890123
+
+
+def test_loads_preserves_big_integers():
+    doc = f'{{"properties": {{"id": {{"const": {BIG}}}}}}}'
+    assert _json.loads(doc)["properties"]["id"]["const"] == BIG
+    assert _json.loads(doc.encode())["properties"]["id"]["const"] == BIG
+
+
+def test_dumps_big_integers():
+    assert json.loads(_json.dumps({"n": BIG})) == {"n": BIG}
+    assert json.loads(_json.dumps_bytes({"n": BIG})) == {"n": BIG}
+
+
+def test_from_json_round_trip_big_integer():
+    converter = SchemaConverter.from_json(
+        f'{{"name": "t", "properties": {{"id": {{"const": {BIG}}}}}}}'
+    )
+    tool = json.loads(converter.to_json("anthropic"))
+    assert tool["input_schema"]["properties"]["id"]["const"] == BIG
+
+
+def test_non_ascii_output_does_not_depend_on_indent():
+    converter = SchemaConverter({"name": "Get Café", "properties": {}})
+    assert '"Get_Café"' in converter.to_json("openai")
+    assert '"Get_Café"' in converter.to_json("openai", indent=4)
+    assert '"Get_Café"'.encode() in converter.to_bytes("openai", indent=4)
+
+
+@pytest.mark.parametrize("doc", ["[NaN]", "[Infinity]", "[-Infinity]", "[1e400]"])
+def test_loads_accepts_what_stdlib_accepts(doc):
+    expected = json.loads(doc)
+    result = _json.loads(doc)
+    assert repr(result) == repr(expected)
+    assert repr(_json.loads(doc.encode())) == repr(expected)
+
+
+def test_loads_utf16_and_bom():
+    doc = '{"name": "café"}'
+    assert _json.loads(doc.encode("utf-16")) == {"name": "café"}
+    assert _json.loads(b"\xef\xbb\xbf" + doc.encode()) == {"name": "café"}
+
+
+def test_loads_invalid_raises_stdlib_error():
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads("{bad")
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_dumps_non_finite_floats(value):
+    obj = {"a": [1, value]}
+    expected = json.dumps(obj, indent=2)
+    assert _json.dumps(obj) == expected
+    assert _json.dumps_bytes(obj) == expected.encode()
+
+
+def test_dumps_null_is_kept():
+    assert json.loads(_json.dumps({"a": None, "b": [None]})) == {
+        "a": None,
+        "b": [None],
+    }
@@ -0,0 +1,114 @@
+"""Tests for the console entry point and its argparse fast path."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from schema_to_tool import __main__ as entry
+from schema_to_tool.cli import cli
+
+SCHEMA = {
+    "name": "Get Café",
+    "description": "Get the weather",
+    "properties": {"location": {"type": "string"}},
+    "required": ["location"],
+}
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def invalid_file(tmp_path):
+    path = tmp_path / "invalid.json"
+    path.write_text("{bad")
+    return str(path)
+
+
+def run_fast(monkeypatch, capfd, args):
+    """Run the entry point with ``args`` and return (exit code, stdout, stderr)."""
+    monkeypatch.setattr(sys, "argv", ["schema-to-tool", *args])
+    try:
+        entry.main()
+        code = 0
+    except SystemExit as e:
+        code = e.code
+    out, err = capfd.readouterr()
+    return code, out, err
+
+
+def run_click(args):
+    """Run the click CLI with ``args`` and return (exit code, stdout, stderr)."""
+    result = CliRunner().invoke(cli, args)
+    return result.exit_code, result.stdout, result.stderr
+
+
+class TestFastPathMatchesClick:
+    @pytest.mark.parametrize(
+        "options",
+        [["-f", "openai"], ["--format", "anthropic"], ["-f", "openai", "-i", "4"]],
+    )
+    def test_stdout(self, monkeypatch, capfd, schema_file, options):
+        args = ["convert", schema_file, *options]
+        assert run_fast(monkeypatch, capfd, args) == run_click(args)
+
+    def test_output_file(self, monkeypatch, capfd, schema_file, tmp_path):
+        fast_out = tmp_path / "fast.json"
+        click_out = tmp_path / "click.json"
+
+        args = ["convert", schema_file, "-f", "openai", "-o"]
+        fast = run_fast(monkeypatch, capfd, [*args, str(fast_out)])
+        slow = run_click([*args, str(click_out)])
+
+        assert fast[0] == slow[0] == 0
+        assert fast_out.read_bytes() == click_out.read_bytes()
+
+    def test_invalid_json(self, monkeypatch, capfd, invalid_file):
+        args = ["convert", invalid_file, "-f", "openai"]
+        fast = run_fast(monkeypatch, capfd, args)
+        slow = run_click(args)
+        assert fast == slow
+        assert fast[0] == 1
+        assert "Invalid JSON in schema file" in fast[2]
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["convert", "missing.json", "-f", "openai"],
+            ["convert", "SCHEMA", "--format", "xml"],
+            ["convert", "SCHEMA"],
+            ["convert", "SCHEMA", "--form", "openai"],
+        ],
+    )
+    def test_usage_errors(self, monkeypatch, capfd, schema_file, args):
+        args = [schema_file if a == "SCHEMA" else a for a in args]
+        fast = run_fast(monkeypatch, capfd, args)
+        slow = run_click(args)
+        assert fast[0] == slow[0] == 2
+
+
+def test_convert_does_not_import_click(schema_file):
+    code = (
+        "import sys\n"
+        "from schema_to_tool.__main__ import main\n"
+        f"sys.argv = ['schema-to-tool', 'convert', {schema_file!r}, '-f', 'openai']\n"
+        "main()\n"
+        "assert 'click' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_other_commands_use_click(monkeypatch, capfd):
+    code, out, _ = run_fast(monkeypatch, capfd, ["--version"])
+    assert code == 0
+    assert "schema-to-tool" in out
@@ -0,0 +1,24 @@
+"""Tests for the raw file output helper."""
+
+import os
+
+from schema_to_tool._output import write_bytes
+
+
+def test_write_bytes_creates_and_truncates(tmp_path):
+    path = tmp_path / "out.json"
+    write_bytes(str(path), b"a much longer first payload")
+    write_bytes(str(path), b"short")
+    assert path.read_bytes() == b"short"
+
+
+def test_write_bytes_respects_umask(tmp_path):
+    old_umask = os.umask(0o002)
+    try:
+        write_bytes(str(tmp_path / "out.json"), b"{}")
+        (tmp_path / "reference.json").write_bytes(b"{}")
+    finally:
+        os.umask(old_umask)
+
+    mode = os.stat(tmp_path / "out.json").st_mode & 0o777
+    assert mode == os.stat(tmp_path / "reference.json").st_mode & 0o777 == 0o664